@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+MODULES = ('options.inspectors', 'options.utils.common', 'options.utils.historical', 'options.utils.options', 'options.utils.plot')
+DEFERRED = ('requests', 'rauth', 'toolz', 'websockets', 'options.data.market', 'options.data.historical')
+BUDGET_US = 100000
+
+
+def import_times(module: str) -> dict:
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True
+    ).stderr
+    times = {}
+    for line in stderr.splitlines()[1:]:
+        _, cumulative_us, name = line.split('|')
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def main(budget_us: int = BUDGET_US) -> int:
+    failures = []
+    for module in MODULES:
+        times = import_times(module)
+        print(f'{module}: {times[module]}us')
+        failures += [f'{module} imports {name} eagerly' for name in DEFERRED if name in times]
+        if times[module] > budget_us:
+            failures.append(f'{module} took {times[module]}us (budget {budget_us}us)')
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*map(int, sys.argv[1:2])))
@@ -1,17 +1,23 @@
 from typing import Tuple
 
-import requests
 from datetime import date
 
 from options.models import HistoricalPrice, TimeRange
+from options.utils.metrics import timer, count
 
 
 def get_historical_prices(symbol: str, time_range: TimeRange) -> Tuple[HistoricalPrice, ...]:
+    import requests
+
     start = int(time_range.start.timestamp())
     end = int(time_range.end.timestamp())
     url = f'https://query1.finance.yahoo.com/v7/finance/download/{symbol}?period1={start}&period2={end}&interval=1d&events=history&includeAdjustedClose=true'
-    rows = requests.get(url, headers={'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/95.0.4638.54 Safari/537.36'}).text.split('\n')
+    with timer('request_seconds', endpoint='yahoo_download'):
+        res = requests.get(url, headers={'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/95.0.4638.54 Safari/537.36'})
+    count('response_bytes', len(res.content), endpoint='yahoo_download')
+    rows = res.text.split('\n')
     data = tuple([HistoricalPrice(date.fromisoformat(row[0]), float(row[4])) for row in map(lambda r: r.split(','), rows[1:])])
+    count('objects_constructed', len(data), model='HistoricalPrice')
     return data
 
 
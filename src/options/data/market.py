@@ -1,17 +1,20 @@
-from typing import Tuple, Callable, Any, Union, Optional
+from typing import Tuple, Callable, Any, Union, Optional, TYPE_CHECKING
 
-import requests
-import re
-from rauth import OAuth1Service, OAuth1Session
 import os
 from datetime import date
 from functools import lru_cache
 
 from options.models import Option, OptionPair, OptionType, Stock, ExpiryType, Greeks, QuoteDetail
+from options.utils.metrics import timer, count, register_cache
+
+if TYPE_CHECKING:
+    from rauth import OAuth1Session
 
 
 @lru_cache
-def session() -> OAuth1Session:
+def session() -> 'OAuth1Session':
+    from rauth import OAuth1Service
+
     api_key = os.environ.get('ETRADE_KEY')
     api_secret = os.environ.get('ETRADE_SECRET')
     assert api_key and api_secret, 'Environment variables ETRADE_KEY and ETRADE_SECRET must be set.'
@@ -39,12 +42,19 @@ def session() -> OAuth1Session:
     return _session
 
 
+register_cache('etrade_session', session)
+
+
 def get_quote_detail(symbols: Tuple[str, ...]) -> Tuple[QuoteDetail, ...]:
     _symbols = ','.join(symbols)
     params = dict(
         requireEarningsDate=True
     )
-    quotes = session().get(f'https://api.etrade.com/v1/market/quote/{_symbols}.json', params=params).json()
+    _session = session()
+    with timer('request_seconds', endpoint='quote'):
+        _res = _session.get(f'https://api.etrade.com/v1/market/quote/{_symbols}.json', params=params)
+    count('response_bytes', len(_res.content), endpoint='quote')
+    quotes = _res.json()
     assert 'QuoteData' in quotes['QuoteResponse'], [message['description'] for message in quotes['QuoteResponse']['Messages']['Message']]
     quotes = [[q for q in quotes['QuoteResponse']['QuoteData'] if q['Product']['symbol'] == symbol][0] for symbol in symbols]
 
@@ -62,6 +72,7 @@ def get_quote_detail(symbols: Tuple[str, ...]) -> Tuple[QuoteDetail, ...]:
         quote['All']['low52'],
         quote['All']['averageVolume'],
     ) for quote in quotes]
+    count('objects_constructed', len(quote_details), model='QuoteDetail')
     return tuple(quote_details)
 
 
@@ -70,7 +81,10 @@ def get_expiry_dates(symbol: str, expiry_type: ExpiryType = ExpiryType.Weekly) -
         symbol=symbol,
         expiryType=expiry_type.value
     )
-    _res = session().get('https://api.etrade.com/v1/market/optionexpiredate.json', params=params)
+    _session = session()
+    with timer('request_seconds', endpoint='optionexpiredate'):
+        _res = _session.get('https://api.etrade.com/v1/market/optionexpiredate.json', params=params)
+    count('response_bytes', len(_res.content), endpoint='optionexpiredate')
     if not _res.content:
         return ()
     res = _res.json()
@@ -90,7 +104,11 @@ def get_option_pairs(symbol: str, expiry_date: date) -> Tuple[OptionPair, ...]:
         expiryMonth=f'{expiry_date.month}',
         expiryDay=f'{expiry_date.day}'
     )
-    res = session().get('https://api.etrade.com/v1/market/optionchains.json', params=params).json()
+    _session = session()
+    with timer('request_seconds', endpoint='optionchains'):
+        _res = _session.get('https://api.etrade.com/v1/market/optionchains.json', params=params)
+    count('response_bytes', len(_res.content), endpoint='optionchains')
+    res = _res.json()
     assert 'Error' not in res, res['Error']['message']
     option_pairs = res['OptionChainResponse']['OptionPair']
     data = tuple([
@@ -115,12 +133,16 @@ def get_option_pairs(symbol: str, expiry_date: date) -> Tuple[OptionPair, ...]:
             )) for key, option_type, res_key in [('call', OptionType.Call, 'Call'), ('put', OptionType.Put, 'Put')]])
         ) for option_pair in option_pairs
     ])
+    count('objects_constructed', len(data), model='OptionPair')
     return data
 
 
 class Screener(tuple):
     def __new__(cls, stocks: Tuple[Stock, ...] = None) -> 'Screener':
         if stocks is None:
+            import re
+            import requests
+
             rows = requests.get(
                 'https://api.nasdaq.com/api/screener/stocks?tableonly=true&limit=25&offset=0&download=true',
                 headers={'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36'}
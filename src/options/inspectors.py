@@ -3,11 +3,10 @@ from typing import Tuple, Callable, Optional
 
 from datetime import date
 
-from options.data.historical import get_historical_prices_by_symbol
-from options.data.market import get_quote_detail, get_option_pairs
 from options.models import Option, OptionBatch, Period, TimeRange, HistoricalPrice
 from options.utils.common import get_weighted_price
 from options.utils.historical import get_collapsed_historical_prices, get_weighted_historical_prices_by_group
+from options.utils.metrics import timed, count, register_cache
 from options.utils.options import get_option_batch_cost, get_return, MULTIPLIER, COMMISSION_PER_CONTRACT, \
     get_highest_option, get_lowest_option, get_net_premium
 
@@ -44,6 +43,7 @@ class OptionWriteScenario:
         self.hedge_option = hedge_option
 
     @property
+    @timed('compute_seconds', function='OptionWriteScenario.periods')
     def periods(self) -> Tuple[Period, ...]:
         num_shares = self.initial_num_shares
         cash = 0
@@ -56,6 +56,7 @@ class OptionWriteScenario:
                 cash -= purchase_batch_size * (self.share_price * MULTIPLIER + 0)
                 num_shares += purchase_batch_size * MULTIPLIER
             periods.append(Period(cash, num_shares, net_premium))
+        count('objects_constructed', len(periods), model='Period')
         return tuple(periods)
 
     @property
@@ -73,6 +74,8 @@ class OptionWriteScenario:
 
 class OptionInspector:
     def __init__(self, symbol: str, expiry_date: date):
+        from options.data.market import get_quote_detail, get_option_pairs
+
         self.symbol = symbol
         self.expiry_date = expiry_date
         self.quote_detail, = get_quote_detail((self.symbol,))
@@ -110,6 +113,8 @@ class PortfolioInspector:
         self.symbols = symbols
 
     def present_value(self, share_counts: Tuple[int, ...]) -> float:
+        from options.data.market import get_quote_detail
+
         last_prices = map(lambda q: q.last_price, get_quote_detail(tuple(symbol for symbol in self.symbols)))
         return sum([get_weighted_price(last_price, share_count) for last_price, share_count in zip(last_prices, share_counts)])
 
@@ -120,4 +125,9 @@ class PortfolioInspector:
 
     @lru_cache
     def historical_prices_by_symbol(self, time_range: TimeRange):
+        from options.data.historical import get_historical_prices_by_symbol
+
         return get_historical_prices_by_symbol(self.symbols, time_range)
+
+
+register_cache('portfolio_historical_prices', PortfolioInspector.historical_prices_by_symbol)
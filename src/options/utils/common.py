@@ -4,6 +4,7 @@ from functools import reduce
 from typing import Tuple, Any, Callable, Mapping
 
 from options.models import DateRange, TimeRange
+from options.utils.metrics import timed
 
 
 def to_timestamp(date: _date):
@@ -34,6 +35,7 @@ def get_changed_price(price: float, percentage_change: float):
     return (1 + percentage_change) * price
 
 
+@timed('compute_seconds', function='create_balanced_portfolio')
 def create_balanced_portfolio(
         max_spend: float,
         items: Tuple[Any, ...],
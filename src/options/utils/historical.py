@@ -1,9 +1,8 @@
 from typing import Tuple, Callable
 
-from toolz import groupby, concat
-
 from options.models import HistoricalPrice, TimeRange, PriceChange, DateRange
 from options.utils.common import get_weighted_price
+from options.utils.metrics import timed, count
 
 
 def get_price_changes(prices: Tuple[HistoricalPrice, ...], period_days: int) -> Tuple[PriceChange, ...]:
@@ -21,12 +20,16 @@ def get_largest_change(changes: Tuple[PriceChange, ...], is_larger: Callable[[fl
     return largest_change
 
 
+@timed('compute_seconds', function='get_largest_changes')
 def get_largest_changes(prices: Tuple[HistoricalPrice, ...], max_period_days: int, is_larger: Callable[[float, float], bool]) -> Tuple[PriceChange, ...]:
+    from toolz import groupby
+
     all_changes = ()
     for i in range(1, max_period_days + 1):
         all_changes = all_changes + get_price_changes(prices, period_days=i)
     changes_by_start_date = groupby(lambda change: change.date_range.start, all_changes)
     largest_changes = tuple([get_largest_change(tuple(changes), is_larger) for _, changes in changes_by_start_date.items()])
+    count('objects_constructed', len(all_changes), model='PriceChange')
     return largest_changes
 
 
@@ -51,6 +54,8 @@ def get_weighted_historical_prices_by_group(historical_prices_by_group: Tuple[Tu
 
 
 def get_collapsed_historical_prices(historical_prices_groups: Tuple[Tuple[HistoricalPrice, ...], ...]):
+    from toolz import groupby, concat
+
     assert len(set([len(historical_prices) for historical_prices in historical_prices_groups])) == 1, 'Different sized price ranges can not be collapsed.'
     historical_prices_by_date = groupby(lambda historical_price: historical_price.date, concat(historical_prices_groups))
     collapsed = [
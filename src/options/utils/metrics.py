@@ -0,0 +1,151 @@
+import os
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from functools import wraps
+from threading import Lock
+from typing import Tuple, Callable, Any, Mapping, Optional
+
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+_enabled = os.environ.get('OPTIONS_METRICS', '') not in ('', '0')
+_lock = Lock()
+_counters = {}
+_histograms = {}
+_caches = {}
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def _key(name: str, labels: Optional[Mapping[str, str]]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    return name, tuple(sorted(labels.items())) if labels else ()
+
+
+def count(name: str, value: float = 1, **labels: str):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, seconds: float, **labels: str):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = dict(count=0, sum=0.0, buckets=[0] * len(BUCKETS))
+        histogram['count'] += 1
+        histogram['sum'] += seconds
+        histogram['buckets'][bisect_left(BUCKETS, seconds)] += 1
+
+
+class _Timer:
+    def __init__(self, name: str, labels: Mapping[str, str]):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        observe(self.name, time.perf_counter() - self.start, **self.labels)
+
+
+_null_timer = nullcontext()
+
+
+def timer(name: str, **labels: str):
+    return _Timer(name, labels) if _enabled else _null_timer
+
+
+def timed(name: str, **labels: str) -> Callable[[Callable], Callable]:
+    def _decorator(func):
+        @wraps(func)
+        def _func(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start, **labels)
+        return _func
+    return _decorator
+
+
+def register_cache(name: str, func: Any):
+    _caches[name] = func
+
+
+def _format(key: Tuple[str, Tuple[Tuple[str, str], ...]], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    name, labels = key
+    labels = labels + extra
+    if not labels:
+        return name
+    return name + '{' + ','.join(f'{label}="{value}"' for label, value in labels) + '}'
+
+
+def snapshot() -> dict:
+    with _lock:
+        counters = {_format(key): value for key, value in _counters.items()}
+        histograms = {
+            _format(key): dict(
+                count=histogram['count'],
+                sum=histogram['sum'],
+                buckets={bound: sum(histogram['buckets'][:i + 1]) for i, bound in enumerate(BUCKETS)},
+            ) for key, histogram in _histograms.items()
+        }
+    caches = {name: func.cache_info()._asdict() for name, func in _caches.items()}
+    return dict(enabled=_enabled, counters=counters, histograms=histograms, caches=caches)
+
+
+def prometheus(prefix: str = 'options_') -> str:
+    lines = []
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted((key, dict(histogram, buckets=list(histogram['buckets']))) for key, histogram in _histograms.items())
+    typed = set()
+    for (name, labels), value in counters:
+        if name not in typed:
+            typed.add(name)
+            lines.append(f'# TYPE {prefix}{name} counter')
+        lines.append(f'{_format((prefix + name, labels))} {value}')
+    for (name, labels), histogram in histograms:
+        if name not in typed:
+            typed.add(name)
+            lines.append(f'# TYPE {prefix}{name} histogram')
+        cumulative = 0
+        for bound, bucket in zip(BUCKETS, histogram['buckets']):
+            cumulative += bucket
+            le = '+Inf' if bound == float('inf') else f'{bound}'
+            lines.append(f'{_format((prefix + name + "_bucket", labels), (("le", le),))} {cumulative}')
+        lines.append(f'{_format((prefix + name + "_sum", labels))} {histogram["sum"]}')
+        lines.append(f'{_format((prefix + name + "_count", labels))} {histogram["count"]}')
+    cache_infos = [(name, func.cache_info()) for name, func in sorted(_caches.items())]
+    for field in ('hits', 'misses') if cache_infos else ():
+        lines.append(f'# TYPE {prefix}cache_{field} counter')
+        for name, info in cache_infos:
+            lines.append(f'{_format((prefix + "cache_" + field, (("cache", name),)))} {getattr(info, field)}')
+    return '\n'.join(lines) + '\n'
@@ -1,8 +1,6 @@
 import json
 from typing import Iterable, Any, Callable
 
-import websockets
-
 DataSet = Any
 
 
@@ -24,6 +22,8 @@ async def plot(
         normalize: bool = True,
         scatter: bool = False
 ):
+    import websockets
+
     _get_x_label = get_x_label or (lambda d: f'{get_x(d)}')
     _get_y_label = get_y_label or (lambda d: f'{get_y(d)}')
     data = dict(